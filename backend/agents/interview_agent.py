@@ -4,11 +4,14 @@ import google.generativeai as genai
 import json
 import re
 import ast
+from draining import gemini_calls
+from agents.recording import recorder, RecordingModel
 
 load_dotenv()
 genai.configure(api_key=os.getenv("GEMINI_API_KEY"))
 
-model = genai.GenerativeModel("gemini-2.0-flash")
+# With GEMINI_RECORD_DIR set, requests/responses are also captured for offline replay (benchmarks/replay.py)
+model = (RecordingModel if recorder.directory else genai.GenerativeModel)("gemini-2.0-flash")
 
 def extract_text_from_response(response) -> str:
     """
@@ -24,6 +27,8 @@ def extract_text_from_response(response) -> str:
     return "Failed to extract valid response text from Gemini."
 
 
+@gemini_calls.track
+@recorder.record
 async def generate_first_question(role: str, experience: str) -> str:
     """
     Generates the first interview question based on the role and experience.
@@ -51,6 +56,8 @@ async def generate_first_question(role: str, experience: str) -> str:
         return "Failed to generate the first question. Please try again later."
 
 
+@gemini_calls.track
+@recorder.record
 async def generate_next_question(
     role: str,
     experience: str,
@@ -95,6 +102,8 @@ async def generate_next_question(
         return "Failed to generate the next question. Please try again later."
 
 # Optional: Function to evaluate an answer
+@gemini_calls.track
+@recorder.record
 async def evaluate_answer(role: str, experience: str, question: str, answer: str) -> dict: 
     ## the output of this function to be dictionary
 
@@ -173,6 +182,8 @@ async def evaluate_answer(role: str, experience: str, question: str, answer: str
         }
 
 
+@gemini_calls.track
+@recorder.record
 def generate_overall_feedback(interview_data: dict) -> str:
     """
     Generates overall feedback for the entire interview.
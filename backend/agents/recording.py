@@ -0,0 +1,190 @@
+# ai-interview-coach-backend/agents/recording.py
+import contextvars
+import functools
+import inspect
+import json
+import os
+import re
+import threading
+from datetime import datetime, timezone
+import google.generativeai as genai
+from google.generativeai import protos
+from google.generativeai.types import content_types, generation_types
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Set to a directory to record every agent call and its Gemini request/response pairs there.
+# The corpus is what benchmarks/replay.py runs against.
+GEMINI_RECORD_DIR = os.getenv("GEMINI_RECORD_DIR")
+CORPUS_FILE_NAME = "gemini_calls.jsonl"
+
+EMAIL_PATTERN = re.compile(r"[\w.+-]+@[\w-]+\.[\w.-]+")
+URL_PATTERN = re.compile(r"https?://\S+")
+# Digit runs with phone-style separators; only replaced if they contain 9+ digits (so years/dates survive)
+PHONE_PATTERN = re.compile(r"\+?\d[\d\s().-]{7,}\d")
+
+# Exchanges recorded for the agent call currently running (None when not recording).
+_current_exchanges: contextvars.ContextVar[list | None] = contextvars.ContextVar("current_exchanges", default=None)
+# Recorded responses the ReplayModel hands out, and the prompts it was asked with.
+_replay_responses: contextvars.ContextVar[list | None] = contextvars.ContextVar("replay_responses", default=None)
+_replay_prompts: contextvars.ContextVar[list | None] = contextvars.ContextVar("replay_prompts", default=None)
+
+
+def _scrub_phone(match: re.Match) -> str:
+    return "<phone>" if sum(c.isdigit() for c in match.group()) >= 9 else match.group()
+
+
+def scrub_pii(value):
+    """
+    Recursively replaces emails, URLs and phone numbers in strings with placeholders.
+    Free-text answers can still contain names or other personal details; review a corpus before sharing it.
+    """
+    if isinstance(value, str):
+        value = EMAIL_PATTERN.sub("<email>", value)
+        value = URL_PATTERN.sub("<url>", value)
+        return PHONE_PATTERN.sub(_scrub_phone, value)
+    if isinstance(value, dict):
+        return {key: scrub_pii(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [scrub_pii(item) for item in value]
+    return value
+
+
+def contents_to_dicts(contents) -> list[dict]:
+    return [type(content).to_dict(content) for content in content_types.to_contents(contents)]
+
+
+def prompt_chars(contents) -> int:
+    """
+    Total text length of a Gemini request, the same whether it's a plain prompt or a chat history.
+    """
+    return sum(len(part.text) for content in content_types.to_contents(contents) for part in content.parts)
+
+
+class CorpusRecorder:
+    def __init__(self, directory: str | None):
+        self.directory = directory
+        self._lock = threading.Lock()
+
+    def write(self, entry: dict) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        line = json.dumps(entry, default=str)
+        with self._lock, open(os.path.join(self.directory, CORPUS_FILE_NAME), "a", encoding="utf-8") as corpus:
+            corpus.write(line + "\n")
+
+    def _entry(self, func, args, kwargs, exchanges, result) -> dict:
+        return {
+            "stage": func.__name__,
+            "recorded_at": datetime.now(timezone.utc).isoformat(),
+            "args": scrub_pii(list(args)),
+            "kwargs": scrub_pii(kwargs),
+            "exchanges": exchanges,
+            "result": scrub_pii(result),
+        }
+
+    def record(self, func):
+        """
+        Decorator for agent functions: when recording is on, writes the call's arguments, result and
+        every Gemini exchange made during it (captured by RecordingModel) to the corpus.
+        Calls that made no Gemini request are not recorded.
+        """
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                if not self.directory:
+                    return await func(*args, **kwargs)
+                exchanges = []
+                token = _current_exchanges.set(exchanges)
+                try:
+                    result = await func(*args, **kwargs)
+                finally:
+                    _current_exchanges.reset(token)
+                # Calls that never reached Gemini (e.g. early returns) have nothing to replay
+                if exchanges:
+                    self.write(self._entry(func, args, kwargs, exchanges, result))
+                return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not self.directory:
+                return func(*args, **kwargs)
+            exchanges = []
+            token = _current_exchanges.set(exchanges)
+            try:
+                result = func(*args, **kwargs)
+            finally:
+                _current_exchanges.reset(token)
+            if exchanges:
+                self.write(self._entry(func, args, kwargs, exchanges, result))
+            return result
+        return wrapper
+
+
+recorder = CorpusRecorder(GEMINI_RECORD_DIR)
+
+
+def load_corpus(directory: str) -> list[dict]:
+    with open(os.path.join(directory, CORPUS_FILE_NAME), encoding="utf-8") as corpus:
+        return [json.loads(line) for line in corpus if line.strip()]
+
+
+class RecordingModel(genai.GenerativeModel):
+    """
+    GenerativeModel that also captures each request/response pair (PII scrubbed) for the recorder.
+    Chat sessions started from it go through it too.
+    """
+
+    def _capture(self, contents, kwargs, response) -> None:
+        exchanges = _current_exchanges.get()
+        if exchanges is None:
+            return
+        exchanges.append({
+            "request": scrub_pii({
+                "contents": contents_to_dicts(contents),
+                "generation_config": kwargs.get("generation_config"),
+            }),
+            "response": scrub_pii(response.to_dict()),
+        })
+
+    def generate_content(self, contents, **kwargs):
+        response = super().generate_content(contents, **kwargs)
+        self._capture(contents, kwargs, response)
+        return response
+
+    async def generate_content_async(self, contents, **kwargs):
+        response = await super().generate_content_async(contents, **kwargs)
+        self._capture(contents, kwargs, response)
+        return response
+
+
+class ReplayModel(genai.GenerativeModel):
+    """
+    GenerativeModel that never calls the network: it answers with the recorded responses set by
+    replaying(), in order, and notes the size of each prompt it was given.
+    """
+
+    def _next_response(self, contents) -> protos.GenerateContentResponse:
+        prompts = _replay_prompts.get()
+        if prompts is not None:
+            prompts.append(prompt_chars(contents))
+        responses = _replay_responses.get()
+        if not responses:
+            raise RuntimeError("No recorded Gemini response left to replay for this call.")
+        return protos.GenerateContentResponse(responses.pop(0))
+
+    def generate_content(self, contents, **kwargs):
+        return generation_types.GenerateContentResponse.from_response(self._next_response(contents))
+
+    async def generate_content_async(self, contents, **kwargs):
+        return generation_types.AsyncGenerateContentResponse.from_response(self._next_response(contents))
+
+
+def replaying(entry: dict, prompts: list) -> None:
+    """
+    Queues a corpus entry's recorded responses for ReplayModel in the current context,
+    and collects the prompt sizes of the replayed calls into `prompts`.
+    """
+    _replay_responses.set([exchange["response"] for exchange in entry["exchanges"]])
+    _replay_prompts.set(prompts)
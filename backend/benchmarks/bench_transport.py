@@ -0,0 +1,115 @@
+# ai-interview-coach-backend/benchmarks/bench_transport.py
+"""
+Cold vs warm request latency for outbound transports, measured against local stand-ins
+so no Google credentials or network access are needed.
+
+- gRPC (Gemini / Firestore): a new channel per request vs one shared, pre-warmed channel
+  using transport.grpc_channel_options().
+- HTTP (Firebase cert fetch): a new requests.Session per request vs one pooled session.
+
+Run from the backend directory:
+    python -m benchmarks.bench_transport --iterations 200
+"""
+import argparse
+import threading
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import grpc
+import requests
+from requests.adapters import HTTPAdapter
+
+from benchmarks.common import measure, summarize, print_table
+from transport import grpc_channel_options, HTTP_POOL_CONNECTIONS, HTTP_POOL_MAXSIZE
+
+ECHO_METHOD = "/bench.Echo/Ping"
+PAYLOAD = b"x" * 512
+
+
+def start_grpc_stand_in() -> tuple[grpc.Server, str]:
+    handler = grpc.method_handlers_generic_handler(
+        "bench.Echo",
+        {"Ping": grpc.unary_unary_rpc_method_handler(lambda request, context: request)}
+    )
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8), options=grpc_channel_options())
+    server.add_generic_rpc_handlers((handler,))
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    return server, f"127.0.0.1:{port}"
+
+
+class _CertHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"  # keep-alive, like the real cert endpoint
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        body = b'{"key": "-----BEGIN CERTIFICATE-----..."}'
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", "public, max-age=0")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+def start_http_stand_in() -> tuple[ThreadingHTTPServer, str]:
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _CertHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/certs"
+
+
+def bench_grpc(target: str, iterations: int) -> list[dict]:
+    def cold():
+        with grpc.insecure_channel(target) as channel:
+            channel.unary_unary(ECHO_METHOD)(PAYLOAD)
+
+    warm_channel = grpc.insecure_channel(target, options=grpc_channel_options())
+    grpc.channel_ready_future(warm_channel).result(timeout=10)
+    warm_call = warm_channel.unary_unary(ECHO_METHOD)
+
+    rows = [
+        summarize("grpc cold (channel per request)", measure(cold, iterations)),
+        summarize("grpc warm (shared channel)", measure(lambda: warm_call(PAYLOAD), iterations)),
+    ]
+    warm_channel.close()
+    return rows
+
+
+def bench_http(url: str, iterations: int) -> list[dict]:
+    def cold():
+        with requests.Session() as session:
+            session.get(url).raise_for_status()
+
+    pooled = requests.Session()
+    pooled.mount("http://", HTTPAdapter(pool_connections=HTTP_POOL_CONNECTIONS, pool_maxsize=HTTP_POOL_MAXSIZE))
+    pooled.get(url).raise_for_status()
+
+    rows = [
+        summarize("http cold (session per request)", measure(cold, iterations)),
+        summarize("http warm (pooled session)", measure(lambda: pooled.get(url).raise_for_status(), iterations)),
+    ]
+    pooled.close()
+    return rows
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=200)
+    args = parser.parse_args()
+
+    grpc_server, grpc_target = start_grpc_stand_in()
+    http_server, http_url = start_http_stand_in()
+    try:
+        rows = bench_grpc(grpc_target, args.iterations) + bench_http(http_url, args.iterations)
+    finally:
+        grpc_server.stop(grace=None)
+        http_server.shutdown()
+
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,155 @@
+# ai-interview-coach-backend/benchmarks/bench_wire_format.py
+"""
+Payload size and serialization time for transcript-heavy responses.
+
+Compares the full /interview/answer response with the compact one (?compact=true),
+and a whole-interview transcript, serialized with the stdlib JSONResponse vs ORJSONResponse,
+then compressed with gzip and Brotli at the levels CompressionMiddleware uses.
+
+Run from the backend directory:
+    python -m benchmarks.bench_wire_format --iterations 2000 --turns 20
+"""
+import argparse
+import gzip
+import random
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+
+from benchmarks.common import measure, summarize, print_table
+from compression import brotli, GZIP_COMPRESS_LEVEL, BROTLI_QUALITY
+from feedback_format import render_display_feedback
+
+SAMPLE_EVALUATION = {
+    "correctness": "Partially Correct",
+    "depth": "Good",
+    "relevance": "High",
+    "score": 7,
+    "detailed_feedback": (
+        "The candidate explained the difference between processes and threads clearly and gave a "
+        "reasonable example of when to prefer each. The answer did not cover the GIL's impact on "
+        "CPU-bound Python code, and the discussion of shared memory was brief. "
+    ) * 3,
+    "suggestions_for_improvement": (
+        "* Explain how the GIL affects CPU-bound work. * Mention multiprocessing and its IPC costs. "
+        "* Give a concrete example of a race condition and how a lock prevents it."
+    ),
+}
+SAMPLE_QUESTION = "Can you walk me through how you would design a rate limiter for a public API?"
+
+
+def answer_response(compact: bool) -> dict:
+    response = {
+        "message": "Answer submitted and next question generated successfully",
+        "next_question": SAMPLE_QUESTION,
+        "evaluation_feedback": SAMPLE_EVALUATION,
+        "display_feedback": render_display_feedback(SAMPLE_EVALUATION),
+    }
+    if compact:
+        del response["display_feedback"]
+    return response
+
+
+SAMPLE_TOPICS = [
+    "rate limiting", "database indexing", "caching strategy", "message queues", "API versioning",
+    "observability", "schema migrations", "load balancing", "authentication", "concurrency",
+]
+SAMPLE_LABELS = [("Correct", "Excellent", "High"), ("Partially Correct", "Good", "High"),
+                 ("Partially Correct", "Shallow", "Medium"), ("Incorrect", "Shallow", "Low")]
+# Vocabulary for per-turn text; real transcripts don't repeat verbatim, so neither should the benchmark.
+SAMPLE_WORDS = sorted({
+    word.strip(".,*'").lower()
+    for text in (SAMPLE_EVALUATION["detailed_feedback"], SAMPLE_EVALUATION["suggestions_for_improvement"], SAMPLE_QUESTION)
+    for word in text.split()
+} | {word for topic in SAMPLE_TOPICS for word in topic.split()} | set(
+    "latency throughput replica partition shard index query cache eviction retry backoff token bucket "
+    "window counter lock transaction isolation deadlock queue consumer producer offset broker trace "
+    "metric log alert dashboard endpoint gateway service client server request response payload "
+    "timeout circuit breaker fallback rollout canary deploy container cluster node memory cpu disk "
+    "network bandwidth encryption certificate session cookie password hash salt migration column".split()
+))
+
+
+def _sample_text(rng: random.Random, sentences: int) -> str:
+    return " ".join(
+        " ".join(rng.choice(SAMPLE_WORDS) for _ in range(rng.randint(8, 20))).capitalize() + "."
+        for _ in range(sentences)
+    )
+
+
+def transcript(turns: int) -> dict:
+    """
+    A synthetic whole-interview transcript in the shape Firestore stores it, with different text every turn
+    (seeded, so sizes are reproducible).
+    """
+    rng = random.Random(turns)
+    questions = [{
+        "text": f"Question {i + 1}: how would you approach {SAMPLE_TOPICS[i % len(SAMPLE_TOPICS)]}? {_sample_text(rng, 1)}",
+        "timestamp": f"2025-01-01T00:{i // 60:02d}:{i % 60:02d}",
+        "from_ai": True,
+    } for i in range(turns + 1)]
+    answers = [{
+        "text": _sample_text(rng, rng.randint(3, 6)),
+        "timestamp": f"2025-01-01T01:{i // 60:02d}:{i % 60:02d}",
+        "from_ai": False,
+    } for i in range(turns)]
+    evaluations = []
+    for i in range(turns):
+        correctness, depth, relevance = SAMPLE_LABELS[i % len(SAMPLE_LABELS)]
+        evaluations.append({
+            "question": questions[i]["text"],
+            "answer": answers[i]["text"],
+            "feedback": {
+                "correctness": correctness,
+                "depth": depth,
+                "relevance": relevance,
+                "score": rng.randint(2, 10),
+                "detailed_feedback": _sample_text(rng, rng.randint(3, 6)),
+                "suggestions_for_improvement": " ".join(f"* {_sample_text(rng, 1)}" for _ in range(rng.randint(2, 4))),
+            },
+            "timestamp": f"2025-01-01T01:{i // 60:02d}:{i % 60:02d}",
+        })
+    return {
+        "role": "Backend Engineer",
+        "experience": "3 years",
+        "questions": questions,
+        "answers": answers,
+        "evaluation": evaluations,
+    }
+
+
+def size_rows(name: str, payload: dict) -> dict:
+    body = ORJSONResponse(payload).body
+    row = {
+        "payload": name,
+        "raw_bytes": len(body),
+        "gzip_bytes": len(gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)),
+    }
+    row["br_bytes"] = len(brotli.compress(body, quality=BROTLI_QUALITY)) if brotli is not None else "n/a"
+    return row
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    parser.add_argument("--turns", type=int, default=20)
+    args = parser.parse_args()
+
+    payloads = {
+        "answer (full)": answer_response(compact=False),
+        "answer (compact)": answer_response(compact=True),
+        f"transcript ({args.turns} turns)": transcript(args.turns),
+    }
+
+    print_table([size_rows(name, payload) for name, payload in payloads.items()])
+    print()
+
+    timing_rows = []
+    for name, payload in payloads.items():
+        for response_class in (JSONResponse, ORJSONResponse):
+            timings = measure(lambda: response_class(payload), args.iterations)
+            timing_rows.append(summarize(f"{name} / {response_class.__name__}", timings))
+    print_table(timing_rows)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+# ai-interview-coach-backend/benchmarks/bench_workers.py
+"""
+Throughput vs worker count for the multi-process deployment (serve.py).
+
+Starts the Redis stand-in, then for each worker count runs serve.py with benchmarks.standin_app
+and SHARED_STATE_URL pointing at the stand-in, and drives it with concurrent clients.
+On an N-core machine throughput should grow roughly linearly up to N workers.
+
+Run from the backend directory:
+    python -m benchmarks.bench_workers --duration 10 --concurrency 64
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import httpx
+
+from benchmarks.common import print_table
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def wait_for_port(port: int, timeout: float = 30) -> None:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(("127.0.0.1", port), timeout=0.5):
+                return
+        except OSError:
+            time.sleep(0.1)
+    raise TimeoutError(f"Nothing listening on port {port} after {timeout}s")
+
+
+async def drive(url: str, duration: float, concurrency: int) -> tuple[int, int]:
+    completed, failed = 0, 0
+    deadline = time.monotonic() + duration
+    limits = httpx.Limits(max_connections=concurrency, max_keepalive_connections=concurrency)
+
+    async with httpx.AsyncClient(limits=limits, timeout=30) as client:
+        async def client_loop():
+            nonlocal completed, failed
+            while time.monotonic() < deadline:
+                try:
+                    response = await client.post(url)
+                except httpx.HTTPError:
+                    # e.g. a connection reset while a worker restarts; count it rather than abort the run
+                    failed += 1
+                    continue
+                if response.status_code == 200:
+                    completed += 1
+                else:
+                    failed += 1
+
+        await asyncio.gather(*(client_loop() for _ in range(concurrency)))
+    return completed, failed
+
+
+def bench_worker_count(workers: int, state_url: str, args) -> dict:
+    port = free_port()
+    env = dict(
+        os.environ,
+        SHARED_STATE_URL=state_url,
+        STANDIN_LATENCY_SECONDS=str(args.latency),
+        STANDIN_RENDER_REPEATS=str(args.render_repeats),
+    )
+    server = subprocess.Popen(
+        [sys.executable, "serve.py", "--app", "benchmarks.standin_app:app",
+         "--host", "127.0.0.1", "--port", str(port), "--workers", str(workers)],
+        env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_port(port)
+        # Short warm-up so every worker has imported the app and opened its state connection
+        asyncio.run(drive(f"http://127.0.0.1:{port}/answer", 1, args.concurrency))
+        completed, failed = asyncio.run(drive(f"http://127.0.0.1:{port}/answer", args.duration, args.concurrency))
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+
+    return {
+        "workers": workers,
+        "requests": completed,
+        "failed": failed,
+        "req_per_s": completed / args.duration,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, nargs="+", default=None,
+                        help="Worker counts to try (default: 1, 2, 4, ... up to the core count)")
+    parser.add_argument("--duration", type=float, default=10)
+    parser.add_argument("--concurrency", type=int, default=64)
+    parser.add_argument("--latency", type=float, default=0.0, help="Simulated Gemini latency per request, seconds")
+    parser.add_argument("--render-repeats", type=int, default=200, help="CPU work per request")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    worker_counts = args.workers or sorted({1, *(2 ** i for i in range(1, cores.bit_length()) if 2 ** i <= cores), cores})
+
+    state_port = free_port()
+    state_server = subprocess.Popen(
+        [sys.executable, "redis_standin.py", "--port", str(state_port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+    )
+    try:
+        wait_for_port(state_port)
+        state_url = f"redis://127.0.0.1:{state_port}/0"
+        rows = [bench_worker_count(workers, state_url, args) for workers in worker_counts]
+    finally:
+        state_server.terminate()
+        state_server.wait(timeout=10)
+
+    print(f"cores: {cores}")
+    print_table(rows)
+
+
+if __name__ == "__main__":
+    main()
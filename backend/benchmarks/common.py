@@ -0,0 +1,37 @@
+# ai-interview-coach-backend/benchmarks/common.py
+import statistics
+import time
+
+
+def measure(func, iterations: int) -> list[float]:
+    """
+    Calls func() `iterations` times and returns each call's wall time in milliseconds.
+    """
+    timings = []
+    for _ in range(iterations):
+        start = time.perf_counter()
+        func()
+        timings.append((time.perf_counter() - start) * 1000)
+    return timings
+
+
+def summarize(name: str, timings: list[float]) -> dict:
+    ordered = sorted(timings)
+    return {
+        "name": name,
+        "n": len(ordered),
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": ordered[len(ordered) // 2],
+        "p95_ms": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+    }
+
+
+def print_table(rows: list[dict]) -> None:
+    if not rows:
+        return
+    columns = list(rows[0].keys())
+    formatted = [[f"{row[c]:.3f}" if isinstance(row[c], float) else str(row[c]) for c in columns] for row in rows]
+    widths = [max(len(c), *(len(r[i]) for r in formatted)) for i, c in enumerate(columns)]
+    print("  ".join(c.ljust(w) for c, w in zip(columns, widths)))
+    for r in formatted:
+        print("  ".join(v.ljust(w) for v, w in zip(r, widths)))
@@ -0,0 +1,236 @@
+# ai-interview-coach-backend/benchmarks/replay.py
+"""
+Offline replay of recorded Gemini traffic through the prompt and parse pipeline.
+
+Record a corpus by running the backend with GEMINI_RECORD_DIR set (PII is scrubbed as it's written).
+This tool then re-runs each recorded agent call with its original arguments, answering every Gemini
+request from the recording, so no network or API key is needed and results are deterministic.
+The post-processing each route applies (render_display_feedback, format_overall_feedback) is replayed too.
+
+Per stage it reports prompt size (current prompts, estimated tokens, and the token count Gemini
+reported at record time), parse failures, results that differ from the recording, and CPU time.
+With --baseline it acts as a regression gate for prompt/parser changes: it exits non-zero if the parse
+failure rate rises or prompts grow past --max-token-growth. CPU changes are reported as advisory
+(they're noisy and machine-dependent) unless --gate-cpu is given.
+
+Run from the backend directory:
+    python -m benchmarks.replay --corpus ./replay_corpus --output replay_report.json
+    python -m benchmarks.replay --corpus ./replay_corpus --baseline replay_report.json
+"""
+import argparse
+import asyncio
+import inspect
+import json
+import statistics
+import sys
+import time
+
+from agents import interview_agent
+from agents.recording import ReplayModel, load_corpus, recorder, replaying, scrub_pii
+from benchmarks.common import print_table
+from feedback_format import render_display_feedback, format_overall_feedback
+
+# Rough characters-per-token ratio for English prompts; only used to compare prompt versions offline.
+CHARS_PER_TOKEN = 4
+OVERALL_FEEDBACK_SECTIONS = ("strengths", "weaknesses", "areas_for_improvement", "general_recommendation")
+
+
+def _question_failed(result) -> bool:
+    return not isinstance(result, str) or result.startswith("Failed to")
+
+
+def _evaluation_failed(result) -> bool:
+    return not isinstance(result, dict) or str(result.get("detailed_feedback", "")).startswith("Evaluation failed")
+
+
+def _overall_feedback_failed(result) -> bool:
+    return not isinstance(result, str) or result.startswith("Failed to generate overall feedback")
+
+
+def _formatted_feedback_failed(formatted: dict) -> bool:
+    # None of the headings matched, so everything fell into overall_assessment (or nothing was parsed)
+    return not any(formatted.get(section) for section in OVERALL_FEEDBACK_SECTIONS)
+
+
+# stage -> (agent function, parse check on its result, route post-processing and its parse check)
+STAGES = {
+    "generate_first_question": (interview_agent.generate_first_question, _question_failed, None),
+    "generate_next_question": (interview_agent.generate_next_question, _question_failed, None),
+    "evaluate_answer": (interview_agent.evaluate_answer, _evaluation_failed, (render_display_feedback, lambda formatted: False)),
+    "generate_overall_feedback": (interview_agent.generate_overall_feedback, _overall_feedback_failed, (format_overall_feedback, _formatted_feedback_failed)),
+}
+
+
+def _normalized(value):
+    return json.loads(json.dumps(scrub_pii(value), default=str))
+
+
+def _recorded_prompt_tokens(entry: dict) -> int | None:
+    counts = [exchange["response"].get("usage_metadata", {}).get("prompt_token_count") for exchange in entry["exchanges"]]
+    counts = [count for count in counts if count]
+    return sum(counts) if counts else None
+
+
+class StageStats:
+    def __init__(self, name: str):
+        self.name = name
+        self.calls = 0
+        self.parse_failures = 0
+        self.changed = 0
+        self.prompt_chars: list[int] = []
+        self.recorded_prompt_tokens: list[int] = []
+        self.cpu_ms: list[float] = []
+
+    def row(self) -> dict:
+        mean_prompt_chars = statistics.fmean(self.prompt_chars) if self.prompt_chars else 0.0
+        return {
+            "stage": self.name,
+            "calls": self.calls,
+            "parse_failures": self.parse_failures,
+            "changed": self.changed,
+            "prompt_chars": mean_prompt_chars,
+            "est_prompt_tokens": mean_prompt_chars / CHARS_PER_TOKEN,
+            "recorded_prompt_tokens": statistics.fmean(self.recorded_prompt_tokens) if self.recorded_prompt_tokens else "n/a",
+            "cpu_ms": statistics.fmean(self.cpu_ms) if self.cpu_ms else 0.0,
+        }
+
+
+async def _timed_call(func, args, kwargs):
+    start = time.process_time()
+    result = func(*args, **kwargs)
+    if inspect.isawaitable(result):
+        result = await result
+    return result, (time.process_time() - start) * 1000
+
+
+async def replay(corpus: list[dict], repeat: int) -> list[dict]:
+    # Answer every Gemini request from the recording and don't re-record what we replay.
+    interview_agent.model = ReplayModel(interview_agent.model.model_name)
+    recorder.directory = None
+
+    stats: dict[str, StageStats] = {}
+    for entry in corpus:
+        stage = entry["stage"]
+        if stage not in STAGES:
+            print(f"[WARN] Skipping corpus entry for unknown stage '{stage}'")
+            continue
+        if not entry["exchanges"]:
+            # Never reached Gemini (recorded by an older recorder); replaying it would only skew the stats
+            continue
+        func, failed, post_process = STAGES[stage]
+        agent_stats = stats.setdefault(stage, StageStats(stage))
+
+        # Run `repeat` times and keep the fastest run: CPU time is the noisy part, results are deterministic.
+        cpu_runs, post_cpu_runs = [], []
+        for attempt in range(repeat):
+            prompts = []
+            replaying(entry, prompts)
+            result, cpu_ms = await _timed_call(func, entry["args"], entry["kwargs"])
+            cpu_runs.append(cpu_ms)
+            if post_process:
+                post_func, post_failed = post_process
+                formatted, post_cpu_ms = await _timed_call(post_func, [result], {})
+                post_cpu_runs.append(post_cpu_ms)
+            if attempt == 0:
+                first_result, first_prompts = result, prompts
+                first_formatted = formatted if post_process else None
+
+        agent_stats.calls += 1
+        agent_stats.parse_failures += failed(first_result)
+        agent_stats.changed += _normalized(first_result) != entry["result"]
+        agent_stats.prompt_chars.append(sum(first_prompts))
+        recorded_tokens = _recorded_prompt_tokens(entry)
+        if recorded_tokens is not None:
+            agent_stats.recorded_prompt_tokens.append(recorded_tokens)
+        agent_stats.cpu_ms.append(min(cpu_runs))
+
+        if post_process:
+            post_stats = stats.setdefault(f"{stage}/{post_func.__name__}", StageStats(f"{stage}/{post_func.__name__}"))
+            post_stats.calls += 1
+            post_stats.parse_failures += post_failed(first_formatted)
+            post_stats.cpu_ms.append(min(post_cpu_runs))
+
+    return [stage_stats.row() for stage_stats in stats.values()]
+
+
+def find_regressions(rows: list[dict], baseline: list[dict], max_token_growth: float) -> list[str]:
+    """
+    Hard gate: parse failure rate and prompt size, which are deterministic for a given corpus.
+    """
+    regressions = []
+    baseline_by_stage = {row["stage"]: row for row in baseline}
+    for row in rows:
+        base = baseline_by_stage.get(row["stage"])
+        if base is None:
+            continue
+        stage = row["stage"]
+        failure_rate = row["parse_failures"] / max(row["calls"], 1)
+        base_failure_rate = base["parse_failures"] / max(base["calls"], 1)
+        if failure_rate > base_failure_rate:
+            regressions.append(f"{stage}: parse failure rate {base_failure_rate:.1%} -> {failure_rate:.1%}")
+        if base["est_prompt_tokens"] and row["est_prompt_tokens"] > base["est_prompt_tokens"] * (1 + max_token_growth):
+            regressions.append(f"{stage}: est. prompt tokens {base['est_prompt_tokens']:.0f} -> {row['est_prompt_tokens']:.0f}")
+    return regressions
+
+
+def find_cpu_changes(rows: list[dict], baseline: list[dict], max_cpu_growth: float) -> list[str]:
+    """
+    CPU time growth past max_cpu_growth. Sub-millisecond timings are noisy and depend on the machine,
+    so these are advisory unless --gate-cpu is given (only do that against a baseline from the same host).
+    """
+    changes = []
+    baseline_by_stage = {row["stage"]: row for row in baseline}
+    for row in rows:
+        base = baseline_by_stage.get(row["stage"])
+        if base and base["cpu_ms"] and row["cpu_ms"] > base["cpu_ms"] * (1 + max_cpu_growth):
+            changes.append(f"{row['stage']}: CPU {base['cpu_ms']:.3f}ms -> {row['cpu_ms']:.3f}ms")
+    return changes
+
+
+def _positive_int(value: str) -> int:
+    number = int(value)
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {number}")
+    return number
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--corpus", required=True, help="Directory recorded with GEMINI_RECORD_DIR")
+    parser.add_argument("--repeat", type=_positive_int, default=5, help="Runs per entry; the fastest CPU time is kept")
+    parser.add_argument("--output", help="Write the report as JSON (use it as a later --baseline)")
+    parser.add_argument("--baseline", help="Report JSON to compare against; exits 1 on regression")
+    parser.add_argument("--max-token-growth", type=float, default=0.10, help="Allowed prompt size growth (fraction)")
+    parser.add_argument("--max-cpu-growth", type=float, default=0.50, help="CPU time growth (fraction) to report")
+    parser.add_argument("--gate-cpu", action="store_true",
+                        help="Also fail on CPU growth; only meaningful against a baseline from the same host")
+    args = parser.parse_args()
+
+    rows = asyncio.run(replay(load_corpus(args.corpus), args.repeat))
+    print_table(rows)
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as report:
+            json.dump(rows, report, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as report:
+            baseline = json.load(report)
+        regressions = find_regressions(rows, baseline, args.max_token_growth)
+        cpu_changes = find_cpu_changes(rows, baseline, args.max_cpu_growth)
+        if args.gate_cpu:
+            regressions += cpu_changes
+        elif cpu_changes:
+            print("\nCPU changes (advisory):")
+            for change in cpu_changes:
+                print(f"- {change}")
+        if regressions:
+            print("\nRegressions:")
+            for regression in regressions:
+                print(f"- {regression}")
+            sys.exit(1)
+        print("\nNo regressions against baseline.")
+
+
+if __name__ == "__main__":
+    main()
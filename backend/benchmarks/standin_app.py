@@ -0,0 +1,42 @@
+# ai-interview-coach-backend/benchmarks/standin_app.py
+"""
+Stand-in for the /interview/answer path with Gemini and Firestore replaced by local work, so
+worker scaling can be measured without credentials. Each request goes through the shared
+idempotency cache (SHARED_STATE_URL) and does CPU work comparable to parsing and rendering feedback.
+"""
+import asyncio
+import os
+import uuid
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from benchmarks.bench_wire_format import SAMPLE_EVALUATION, SAMPLE_QUESTION
+from feedback_format import render_display_feedback
+from idempotency import idempotency_cache
+
+# Simulated Gemini latency and CPU work per request; set by bench_workers.py.
+STANDIN_LATENCY_SECONDS = float(os.getenv("STANDIN_LATENCY_SECONDS", "0"))
+STANDIN_RENDER_REPEATS = int(os.getenv("STANDIN_RENDER_REPEATS", "200"))
+
+app = FastAPI(default_response_class=ORJSONResponse)
+
+
+async def _answer() -> dict:
+    await asyncio.sleep(STANDIN_LATENCY_SECONDS)
+    for _ in range(STANDIN_RENDER_REPEATS):
+        display_feedback = render_display_feedback(SAMPLE_EVALUATION)
+    return {
+        "next_question": SAMPLE_QUESTION,
+        "evaluation_feedback": SAMPLE_EVALUATION,
+        "display_feedback": display_feedback,
+    }
+
+
+@app.post("/answer")
+async def answer():
+    return await idempotency_cache.run(("bench", uuid.uuid4().hex), _answer)
+
+
+@app.get("/health")
+async def health():
+    return {"pid": os.getpid()}
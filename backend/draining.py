@@ -0,0 +1,68 @@
+# ai-interview-coach-backend/draining.py
+import asyncio
+import functools
+import inspect
+import os
+import threading
+import time
+
+# How long shutdown waits for in-flight work (requests, then Gemini calls) before giving up.
+GRACEFUL_SHUTDOWN_SECONDS = float(os.getenv("GRACEFUL_SHUTDOWN_SECONDS", "30"))
+
+
+class InflightTracker:
+    """
+    Counts calls in progress so shutdown can wait for them to finish.
+    Works for coroutines and for sync functions run in worker threads.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._count = 0
+        self._lock = threading.Lock()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def __enter__(self):
+        with self._lock:
+            self._count += 1
+        return self
+
+    def __exit__(self, *exc_info):
+        with self._lock:
+            self._count -= 1
+        return False
+
+    def track(self, func):
+        """
+        Decorator that counts every call of func (sync or async) as in flight.
+        """
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                with self:
+                    return await func(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with self:
+                return func(*args, **kwargs)
+        return wrapper
+
+    async def drain(self, timeout: float = GRACEFUL_SHUTDOWN_SECONDS) -> bool:
+        """
+        Waits until no calls are in flight. Returns False if some were still running at the timeout.
+        """
+        deadline = time.monotonic() + timeout
+        while self._count > 0:
+            if time.monotonic() >= deadline:
+                print(f"[WARN] Shutdown timed out with {self._count} {self.name} call(s) still in flight")
+                return False
+            await asyncio.sleep(0.1)
+        return True
+
+
+gemini_calls = InflightTracker("Gemini")
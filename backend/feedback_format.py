@@ -0,0 +1,82 @@
+# ai-interview-coach-backend/feedback_format.py
+import re
+
+
+def render_display_feedback(evaluation_feedback_dict: dict) -> str:
+    """
+    Renders the structured per-answer evaluation as the markdown string shown by the frontend.
+    """
+    # Get suggestions for improvement string and replace '*' with '\n*'
+    suggestions_text = evaluation_feedback_dict.get('suggestions_for_improvement', '')
+    # Ensure each bullet point is on a new line for markdown rendering
+    # This handles cases where Gemini might return " * Item1 * Item2" or "Item1. * Item2"
+    # We want to ensure a newline precedes each bullet.
+    if suggestions_text:
+        # Replace common patterns for list items to ensure they start on a new line for markdown
+        # This is a bit of a heuristic; ideally, the AI would generate perfect markdown.
+        # Here we ensure each '*' starts on a new line.
+        suggestions_text = re.sub(r'\*\s*', '\n* ', suggestions_text).strip()
+        if not suggestions_text.startswith('*'): # Ensure the first item also gets a bullet if missing
+            suggestions_text = '* ' + suggestions_text
+        suggestions_text = suggestions_text.replace('\n* * ', '\n* ') # Fix double bullets if they occur
+        suggestions_text = suggestions_text.replace('\n\n*', '\n*') # Avoid double newlines if it's already list-like
+        suggestions_text = suggestions_text.replace('. *', '.\n*') # Ensure new line after a sentence ending period before a bullet
+
+    # Create a display-friendly string from the structured feedback for immediate frontend use
+    return (
+        f"**Correctness:** {evaluation_feedback_dict.get('correctness', 'N/A')}\n"
+        f"**Depth:** {evaluation_feedback_dict.get('depth', 'N/A')}\n"
+        f"**Relevance:** {evaluation_feedback_dict.get('relevance', 'N/A')}\n"
+        f"**Score:** {evaluation_feedback_dict.get('score', 'N/A')}/10\n\n"
+        f"**Detailed Feedback:**\n{evaluation_feedback_dict.get('detailed_feedback', '')}\n\n"
+        f"**Suggestions for Improvement:**\n{suggestions_text}" # Use the formatted suggestions_text
+    ).strip()
+
+
+def format_overall_feedback(raw_feedback: str) -> dict:
+    formatted_feedback = {
+        "overall_assessment": "",
+        "strengths": [],
+        "weaknesses": [],
+        "areas_for_improvement": [],
+        "general_recommendation": ""
+    }
+
+    # Use a more robust splitting pattern that includes the section titles in the split result
+    # and then iterate to pair them up.
+    # The regex ensures that the split preserves the delimiter (the bolded titles).
+    parts = re.split(r'\*\*(Overall Assessment|Strengths|Weaknesses|Areas for Improvement|General Recommendation):\*\*', raw_feedback, flags=re.IGNORECASE)
+
+    # The first part is usually empty or intro text before the first bolded heading
+    if parts and parts[0].strip():
+        # Clean up any introductory phrase that might precede the first actual section
+        intro_text = re.sub(
+            r'^(Okay, based on the provided transcript and evaluations, here\'s an overall assessment of the candidate\'s performance:)',
+            '', parts[0].strip(), flags=re.IGNORECASE
+        ).strip()
+        if intro_text: # Only add if there's actual content
+            formatted_feedback["overall_assessment"] = intro_text
+
+    # Iterate through the parts, pairing heading with content
+    for i in range(1, len(parts), 2):
+        heading_key = parts[i].strip().lower().replace(' ', '_')
+        content = parts[i+1].strip()
+
+        if heading_key == "overall_assessment":
+            # If an overall assessment was already set from the intro, prepend/append if necessary
+            if formatted_feedback["overall_assessment"] and content:
+                # Decide if you want to concatenate or overwrite
+                formatted_feedback["overall_assessment"] = f"{formatted_feedback['overall_assessment']}\n\n{content}"
+            elif content:
+                formatted_feedback["overall_assessment"] = content
+        elif heading_key == "strengths":
+            # Split list items by common bullet indicators
+            formatted_feedback["strengths"] = [item.strip() for item in re.split(r'^\*\s*|\-\s*', content, flags=re.MULTILINE) if item.strip()]
+        elif heading_key == "weaknesses":
+            formatted_feedback["weaknesses"] = [item.strip() for item in re.split(r'^\*\s*|\-\s*', content, flags=re.MULTILINE) if item.strip()]
+        elif heading_key == "areas_for_improvement":
+            formatted_feedback["areas_for_improvement"] = [item.strip() for item in re.split(r'^\*\s*|\-\s*', content, flags=re.MULTILINE) if item.strip()]
+        elif heading_key == "general_recommendation":
+            formatted_feedback["general_recommendation"] = content
+
+    return formatted_feedback
@@ -0,0 +1,144 @@
+# ai-interview-coach-backend/idempotency.py
+import asyncio
+import hashlib
+import json
+import os
+import secrets
+import time
+from typing import Any, Awaitable, Callable, Hashable
+import redis
+from shared_state import shared_state
+
+# How long a completed response is replayed for duplicate requests.
+IDEMPOTENCY_TTL_SECONDS = 15 * 60
+# TTL of the lock on an in-flight key. The owner renews it every third of this while its call runs,
+# so it only lapses (and another worker takes over) if the owner dies or stalls.
+IDEMPOTENCY_LOCK_SECONDS = float(os.getenv("IDEMPOTENCY_LOCK_SECONDS", "30"))
+# How often a worker waiting on another worker's in-flight call checks for its result.
+IDEMPOTENCY_POLL_SECONDS = 0.1
+# Errors from an unreachable or failing state backend. The cache degrades to per-process deduplication
+# on these rather than failing the request.
+BACKEND_ERRORS = (redis.RedisError, OSError)
+
+
+class IdempotencyCache:
+    """
+    Runs a coroutine at most once per key, across all workers sharing the state backend.
+    A duplicate that arrives while the first call is still running waits for that
+    in-flight result; a duplicate that arrives afterwards gets the stored response back.
+    Failed calls are not stored, so a retry after an error does the work again.
+    If the backend is unavailable, calls are only deduplicated within this process.
+    Results must be JSON-serializable.
+    """
+
+    def __init__(self, backend=shared_state, ttl_seconds: float = IDEMPOTENCY_TTL_SECONDS):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        # Calls in flight in this process, so local duplicates share one future instead of polling.
+        self._inflight: dict[Hashable, asyncio.Future] = {}
+
+    @staticmethod
+    def _storage_key(key: Hashable) -> str:
+        # Key parts are client-supplied, so encode them unambiguously (("a:b", "c") != ("a", "b:c"))
+        # and hash the result to keep backend keys short.
+        parts = list(key) if isinstance(key, tuple) else [key]
+        return "idempotency:" + hashlib.sha256(json.dumps(parts, default=str).encode()).hexdigest()
+
+    async def run(self, key: Hashable, func: Callable[[], Awaitable[Any]]) -> Any:
+        while key in self._inflight:
+            future = self._inflight[key]
+            try:
+                # shield() so a waiter being cancelled doesn't cancel the original call
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    raise
+                # The original call was cancelled before finishing; try again ourselves.
+
+        future = asyncio.get_running_loop().create_future()
+        self._inflight[key] = future
+        try:
+            result = await self._run_shared(self._storage_key(key), func)
+        except BaseException as e:
+            if isinstance(e, asyncio.CancelledError):
+                future.cancel()
+            else:
+                future.set_exception(e)
+                future.exception()  # Mark as retrieved so asyncio doesn't log it when nobody was waiting
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            self._inflight.pop(key, None)
+
+    async def _run_shared(self, storage_key: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        result_key = f"{storage_key}:result"
+        lock_key = f"{storage_key}:lock"
+        # Random owner token, so we can tell our lock apart from one another worker took over
+        token = secrets.token_hex(16).encode()
+
+        try:
+            stored = await self._acquire(result_key, lock_key, token)
+        except BACKEND_ERRORS as e:
+            print(f"[WARN] Idempotency backend unavailable, deduplicating within this worker only: {e!r}")
+            return await func()
+        if stored is not None:
+            return json.loads(stored)
+
+        renewal = asyncio.create_task(self._renew_lock(lock_key, token))
+        try:
+            result = await func()
+        except BaseException:
+            renewal.cancel()
+            await asyncio.shield(self._release(lock_key, token))
+            raise
+        renewal.cancel()
+
+        try:
+            # Store the result before releasing the lock so waiters never see neither.
+            await self.backend.set(result_key, json.dumps(result).encode(), ttl_seconds=self.ttl_seconds)
+        except BACKEND_ERRORS as e:
+            print(f"[WARN] Failed to store idempotent result for {result_key}: {e!r}")
+        await self._release(lock_key, token)
+        return result
+
+    async def _acquire(self, result_key: str, lock_key: str, token: bytes) -> bytes | None:
+        """
+        Returns the stored result if there is one; otherwise waits until we hold the lock and returns None.
+        """
+        while True:
+            stored = await self.backend.get(result_key)
+            if stored is not None:
+                return stored
+
+            if await self.backend.set(lock_key, token, ttl_seconds=IDEMPOTENCY_LOCK_SECONDS, only_if_absent=True):
+                return None
+
+            # Another worker owns this key. Wait for its result, or take over if its lock goes away
+            # without one (it failed, or died and the lock expired).
+            deadline = time.monotonic() + IDEMPOTENCY_LOCK_SECONDS
+            while time.monotonic() < deadline:
+                await asyncio.sleep(IDEMPOTENCY_POLL_SECONDS)
+                if await self.backend.get(result_key) is not None or await self.backend.get(lock_key) is None:
+                    break
+
+    async def _release(self, lock_key: str, token: bytes) -> None:
+        # Only release the lock if it's still ours; never delete another worker's lock.
+        try:
+            await self.backend.delete_if_equals(lock_key, token)
+        except BACKEND_ERRORS as e:
+            print(f"[WARN] Failed to release idempotency lock {lock_key}, it expires on its own: {e!r}")
+
+    async def _renew_lock(self, lock_key: str, token: bytes) -> None:
+        while True:
+            await asyncio.sleep(IDEMPOTENCY_LOCK_SECONDS / 3)
+            try:
+                if not await self.backend.expire_if_equals(lock_key, token, IDEMPOTENCY_LOCK_SECONDS):
+                    print(f"[WARN] Lost idempotency lock {lock_key}; another worker may repeat this call")
+                    return
+            except Exception as e:
+                print(f"[WARN] Failed to renew idempotency lock {lock_key}: {e}")
+
+
+idempotency_cache = IdempotencyCache()
@@ -1,13 +1,29 @@
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from routes.user import router as user_router
 from routes.interview import router as interview_router
 from fastapi.middleware.cors import CORSMiddleware
 # Corrected: Import 'router' as 'auth_router' from the 'auth' module
 from auth import auth_router # <--- CORRECTED IMPORT
+from transport import setup_transport, close_transport
+from compression import CompressionMiddleware
+from draining import gemini_calls
+from shared_state import shared_state
 from dotenv import load_dotenv
 import os
 
-app = FastAPI()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Open the shared Gemini/Firestore channels and prefetch Firebase certs before serving traffic
+    await setup_transport()
+    yield
+    # Uvicorn has already drained (or cancelled) in-flight requests. Cancelling a request doesn't stop a
+    # generate_overall_feedback call already running in a worker thread, so wait for those before closing their channels.
+    await gemini_calls.drain()
+    await close_transport()
+    await shared_state.close()
+
+app = FastAPI(lifespan=lifespan)
 
 FRONT_END_API = os.getenv("FRONT_END_API")
 
@@ -24,6 +40,8 @@ app.add_middleware(
     allow_methods=["*"],
     allow_headers=["*"],
 )
+# Brotli/gzip for transcript-heavy responses (feedback and history payloads are mostly repetitive text)
+app.add_middleware(CompressionMiddleware)
 
 # Include your routes
 # Use the aliased name 'auth_router' here
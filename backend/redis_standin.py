@@ -0,0 +1,131 @@
+# ai-interview-coach-backend/redis_standin.py
+"""
+Minimal Redis-protocol (RESP) server backed by MemoryStateBackend, for running several workers
+locally without installing Redis. Supports the commands RedisStateBackend uses:
+PING, GET, SET (PX/EX/NX), DEL, INCR/INCRBY, PEXPIRE/EXPIRE, and EVAL/EVALSHA for the
+compare-and-delete/expire scripts it registers (no general Lua support). Not for production.
+
+    python redis_standin.py --port 6379
+    SHARED_STATE_URL=redis://127.0.0.1:6379/0 python serve.py --workers 4
+"""
+import argparse
+import asyncio
+import hashlib
+from shared_state import MemoryStateBackend, DELETE_IF_EQUALS_SCRIPT, EXPIRE_IF_EQUALS_SCRIPT
+
+# The only scripts we "run": looked up by SHA1 (EVALSHA) or by their text (EVAL)
+KNOWN_SCRIPTS = {
+    hashlib.sha1(DELETE_IF_EQUALS_SCRIPT.encode()).hexdigest(): "delete_if_equals",
+    hashlib.sha1(EXPIRE_IF_EQUALS_SCRIPT.encode()).hexdigest(): "expire_if_equals",
+}
+
+
+def _encode(reply) -> bytes:
+    if reply is None:
+        return b"$-1\r\n"
+    if isinstance(reply, bool):
+        return b":1\r\n" if reply else b":0\r\n"
+    if isinstance(reply, int):
+        return f":{reply}\r\n".encode()
+    if isinstance(reply, Exception):
+        return f"-ERR {reply}\r\n".encode()
+    if reply == "OK" or reply == "PONG":
+        return f"+{reply}\r\n".encode()
+    return b"$" + str(len(reply)).encode() + b"\r\n" + reply + b"\r\n"
+
+
+async def _read_command(reader: asyncio.StreamReader) -> list[bytes] | None:
+    line = await reader.readline()
+    if not line:
+        return None
+    if not line.startswith(b"*"):
+        # Inline command (e.g. typed into telnet)
+        return line.strip().split()
+    args = []
+    for _ in range(int(line[1:])):
+        length = int((await reader.readline())[1:])
+        args.append((await reader.readexactly(length + 2))[:-2])
+    return args
+
+
+class RedisStandIn:
+    def __init__(self):
+        self.backend = MemoryStateBackend()
+
+    async def execute(self, args: list[bytes]):
+        command = args[0].upper()
+        key = args[1].decode() if len(args) > 1 else None
+        if command == b"PING":
+            return "PONG"
+        if command in (b"CLIENT", b"SELECT"):
+            return "OK"
+        if command == b"GET":
+            return await self.backend.get(key)
+        if command == b"SET":
+            ttl_seconds, only_if_absent = None, False
+            options = [arg.upper() for arg in args[3:]]
+            for i, option in enumerate(options):
+                if option == b"PX":
+                    ttl_seconds = int(options[i + 1]) / 1000
+                elif option == b"EX":
+                    ttl_seconds = int(options[i + 1])
+                elif option == b"NX":
+                    only_if_absent = True
+            stored = await self.backend.set(key, args[2], ttl_seconds=ttl_seconds, only_if_absent=only_if_absent)
+            return "OK" if stored else None
+        if command == b"DEL":
+            deleted = 0
+            for arg in args[1:]:
+                if await self.backend.get(arg.decode()) is not None:
+                    deleted += 1
+                await self.backend.delete(arg.decode())
+            return deleted
+        if command in (b"INCR", b"INCRBY"):
+            amount = int(args[2]) if command == b"INCRBY" else 1
+            return await self.backend.incr(key, amount=amount)
+        if command in (b"PEXPIRE", b"EXPIRE"):
+            value = await self.backend.get(key)
+            if value is None:
+                return 0
+            ttl_seconds = int(args[2]) / 1000 if command == b"PEXPIRE" else int(args[2])
+            await self.backend.set(key, value, ttl_seconds=ttl_seconds)
+            return 1
+        if command == b"SCRIPT" and key.upper() == "LOAD":
+            sha = hashlib.sha1(args[2]).hexdigest()
+            return sha.encode() if sha in KNOWN_SCRIPTS else ValueError("only the shared_state scripts are supported")
+        if command in (b"EVAL", b"EVALSHA"):
+            sha = args[1].decode() if command == b"EVALSHA" else hashlib.sha1(args[1]).hexdigest()
+            script = KNOWN_SCRIPTS.get(sha)
+            if script is None:
+                return ValueError("only the shared_state scripts are supported")
+            script_key, value = args[3].decode(), args[4]
+            if script == "delete_if_equals":
+                return int(await self.backend.delete_if_equals(script_key, value))
+            return int(await self.backend.expire_if_equals(script_key, value, int(args[5]) / 1000))
+        return ValueError(f"unknown command '{command.decode()}'")
+
+    async def handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while (args := await _read_command(reader)) is not None:
+                if args:
+                    writer.write(_encode(await self.execute(args)))
+                    await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(host: str, port: int):
+    server = await asyncio.start_server(RedisStandIn().handle, host, port)
+    print(f"[INFO] Redis stand-in listening on {host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=6379)
+    args = parser.parse_args()
+    asyncio.run(serve(args.host, args.port))
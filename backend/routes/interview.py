@@ -1,5 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, HTTPException, status, Header, Query
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
 from agents.interview_agent import (
     generate_first_question,
     generate_next_question,
@@ -8,9 +9,12 @@ from agents.interview_agent import (
 )
 from firebase_admin import firestore
 import asyncio
+import hashlib
+import json
 from auth import get_current_user_data
+from idempotency import idempotency_cache
+from feedback_format import render_display_feedback, format_overall_feedback
 from datetime import datetime
-import re
 import ast  # Needed for safe string-to-dict conversion
 
 
@@ -18,7 +22,8 @@ db = firestore.client()
 
 router = APIRouter(
     prefix="/interview",
-    tags=["Interview Flow"]
+    tags=["Interview Flow"],
+    default_response_class=ORJSONResponse
 )
 
 class InterviewRequest(BaseModel):
@@ -29,59 +34,14 @@ class AnswerRequest(BaseModel):
     interview_id: str
     question_text: str
     answer_text: str
+    # Optional turn sequence number: how many answers the client has already submitted
+    # for this interview. Lets a retried request be recognised without an Idempotency-Key.
+    turn: int | None = Field(default=None, ge=0)
 
 class InterviewEndResponse(BaseModel):
     message: str
     overall_feedback: dict = None
 
-def format_overall_feedback(raw_feedback: str) -> dict:
-    formatted_feedback = {
-        "overall_assessment": "",
-        "strengths": [],
-        "weaknesses": [],
-        "areas_for_improvement": [],
-        "general_recommendation": ""
-    }
-
-    # Use a more robust splitting pattern that includes the section titles in the split result
-    # and then iterate to pair them up.
-    # The regex ensures that the split preserves the delimiter (the bolded titles).
-    parts = re.split(r'\*\*(Overall Assessment|Strengths|Weaknesses|Areas for Improvement|General Recommendation):\*\*', raw_feedback, flags=re.IGNORECASE)
-
-    # The first part is usually empty or intro text before the first bolded heading
-    if parts and parts[0].strip():
-        # Clean up any introductory phrase that might precede the first actual section
-        intro_text = re.sub(
-            r'^(Okay, based on the provided transcript and evaluations, here\'s an overall assessment of the candidate\'s performance:)',
-            '', parts[0].strip(), flags=re.IGNORECASE
-        ).strip()
-        if intro_text: # Only add if there's actual content
-            formatted_feedback["overall_assessment"] = intro_text
-
-    # Iterate through the parts, pairing heading with content
-    for i in range(1, len(parts), 2):
-        heading_key = parts[i].strip().lower().replace(' ', '_')
-        content = parts[i+1].strip()
-
-        if heading_key == "overall_assessment":
-            # If an overall assessment was already set from the intro, prepend/append if necessary
-            if formatted_feedback["overall_assessment"] and content:
-                # Decide if you want to concatenate or overwrite
-                formatted_feedback["overall_assessment"] = f"{formatted_feedback['overall_assessment']}\n\n{content}"
-            elif content:
-                formatted_feedback["overall_assessment"] = content
-        elif heading_key == "strengths":
-            # Split list items by common bullet indicators
-            formatted_feedback["strengths"] = [item.strip() for item in re.split(r'^\*\s*|\-\s*', content, flags=re.MULTILINE) if item.strip()]
-        elif heading_key == "weaknesses":
-            formatted_feedback["weaknesses"] = [item.strip() for item in re.split(r'^\*\s*|\-\s*', content, flags=re.MULTILINE) if item.strip()]
-        elif heading_key == "areas_for_improvement":
-            formatted_feedback["areas_for_improvement"] = [item.strip() for item in re.split(r'^\*\s*|\-\s*', content, flags=re.MULTILINE) if item.strip()]
-        elif heading_key == "general_recommendation":
-            formatted_feedback["general_recommendation"] = content
-
-    return formatted_feedback
-
 
 @router.post('/start')
 async def start_interview(data: InterviewRequest, user_data: dict = Depends(get_current_user_data)):
@@ -137,9 +97,84 @@ async def start_interview(data: InterviewRequest, user_data: dict = Depends(get_
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _build_answer_response(next_question_text: str, evaluation_feedback_dict: dict) -> dict:
+    return {
+        "message": "Answer submitted and next question generated successfully",
+        "next_question": next_question_text,
+        "evaluation_feedback": evaluation_feedback_dict # Keep the structured dict; display_feedback is added in submit_answer
+    }
+
+
+def _replay_answer_response(interview_data: dict, turn: int) -> dict:
+    """
+    Rebuilds the /answer response for an already processed turn from the stored transcript.
+    """
+    questions = interview_data.get('questions', [])
+    evaluations = interview_data.get('evaluation', [])
+
+    next_question_text = ''
+    if turn + 1 < len(questions):
+        question = questions[turn + 1]
+        next_question_text = question.get('text', '') if isinstance(question, dict) else str(question)
+
+    evaluation_feedback_dict = {}
+    if turn < len(evaluations):
+        evaluation = evaluations[turn]
+        feedback = evaluation.get('feedback', {}) if isinstance(evaluation, dict) else evaluation
+        # Older transcripts may hold the feedback as plain text rather than the structured dict
+        evaluation_feedback_dict = feedback if isinstance(feedback, dict) else {"detailed_feedback": str(feedback)}
+    return _build_answer_response(next_question_text, evaluation_feedback_dict)
+
+
+def _request_hash(data: AnswerRequest) -> str:
+    return hashlib.sha256(json.dumps(data.model_dump(), sort_keys=True).encode()).hexdigest()
+
+
 @router.post('/answer')
-async def submit_answer(data: AnswerRequest, user_data: dict = Depends(get_current_user_data)):
+async def submit_answer(
+    data: AnswerRequest,
+    user_data: dict = Depends(get_current_user_data),
+    idempotency_key: str | None = Header(default=None, alias="Idempotency-Key"),
+    compact: bool = Query(default=False, description="Omit display_feedback; the client renders it from evaluation_feedback.")
+):
     user_uid = user_data['uid']
+
+    response = await _submit_answer_once(data, user_uid, idempotency_key)
+    if not compact:
+        # display_feedback is a markdown rendering of evaluation_feedback that roughly doubles the payload.
+        # It's rendered on the way out, so compact mode skips the work and the idempotency cache stores the compact form.
+        response = {**response, "display_feedback": render_display_feedback(response["evaluation_feedback"])}
+    return response
+
+
+async def _submit_answer_once(data: AnswerRequest, user_uid: str, idempotency_key: str | None) -> dict:
+    # Client retries resend the same answer. Run the Gemini work once per key: a duplicate that
+    # arrives mid-flight waits for the first result, a later one gets the stored response.
+    # The key source is part of the key, so a header value can never collide with a turn number.
+    if idempotency_key:
+        request_key = ("header", idempotency_key)
+    elif data.turn is not None:
+        request_key = ("turn", data.turn)
+    else:
+        return await _process_answer(data, user_uid)
+
+    # The request body's hash is stored with the response, so a key reused for a different answer
+    # is rejected instead of silently getting the earlier answer's evaluation back.
+    request_hash = _request_hash(data)
+
+    async def process():
+        return {"request_hash": request_hash, "response": await _process_answer(data, user_uid)}
+
+    stored = await idempotency_cache.run((user_uid, data.interview_id, *request_key), process)
+    if stored["request_hash"] != request_hash:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail="This idempotency key or turn was already used with a different request body."
+        )
+    return stored["response"]
+
+
+async def _process_answer(data: AnswerRequest, user_uid: str) -> dict:
     interview_ref = db.collection('interviews').document(data.interview_id)
 
     try:
@@ -151,6 +186,25 @@ async def submit_answer(data: AnswerRequest, user_data: dict = Depends(get_curre
         if interview_data.get('user_uid') != user_uid or not interview_data.get('is_active'):
             raise HTTPException(status_code=403, detail="Unauthorized or inactive interview.")
 
+        answers = interview_data.get('answers', [])
+        if data.turn is not None:
+            if data.turn < len(answers):
+                # This turn was already processed (e.g. by another worker or before a restart);
+                # rebuild the original response from the stored transcript instead of calling Gemini again.
+                answer = answers[data.turn]
+                stored_answer_text = answer.get("text", "") if isinstance(answer, dict) else str(answer)
+                if stored_answer_text != data.answer_text:
+                    raise HTTPException(
+                        status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+                        detail=f"Turn {data.turn} was already answered with a different answer."
+                    )
+                return _replay_answer_response(interview_data, data.turn)
+            if data.turn > len(answers):
+                raise HTTPException(
+                    status_code=status.HTTP_409_CONFLICT,
+                    detail=f"Turn {data.turn} is ahead of the interview ({len(answers)} answers submitted)."
+                )
+
         # 🧠 Evaluate the user's answer using Gemini
         # Now expects a dictionary from evaluate_answer
         evaluation_feedback_dict = await evaluate_answer(
@@ -165,7 +219,6 @@ async def submit_answer(data: AnswerRequest, user_data: dict = Depends(get_curre
         # ✅ Build valid conversation history for Gemini
         conversation_history = []
         questions = interview_data.get('questions', [])
-        answers = interview_data.get('answers', [])
 
         for i in range(len(questions)):
             question = questions[i]
@@ -219,39 +272,10 @@ async def submit_answer(data: AnswerRequest, user_data: dict = Depends(get_curre
             "updated_at": firestore.SERVER_TIMESTAMP
         })
 
-        # Get suggestions for improvement string and replace '*' with '\n*'
-        suggestions_text = evaluation_feedback_dict.get('suggestions_for_improvement', '')
-        # Ensure each bullet point is on a new line for markdown rendering
-        # This handles cases where Gemini might return " * Item1 * Item2" or "Item1. * Item2"
-        # We want to ensure a newline precedes each bullet.
-        if suggestions_text:
-            # Replace common patterns for list items to ensure they start on a new line for markdown
-            # This is a bit of a heuristic; ideally, the AI would generate perfect markdown.
-            # Here we ensure each '*' starts on a new line.
-            suggestions_text = re.sub(r'\*\s*', '\n* ', suggestions_text).strip()
-            if not suggestions_text.startswith('*'): # Ensure the first item also gets a bullet if missing
-                suggestions_text = '* ' + suggestions_text
-            suggestions_text = suggestions_text.replace('\n* * ', '\n* ') # Fix double bullets if they occur
-            suggestions_text = suggestions_text.replace('\n\n*', '\n*') # Avoid double newlines if it's already list-like
-            suggestions_text = suggestions_text.replace('. *', '.\n*') # Ensure new line after a sentence ending period before a bullet
-
-        # Create a display-friendly string from the structured feedback for immediate frontend use
-        display_feedback_str = (
-            f"**Correctness:** {evaluation_feedback_dict.get('correctness', 'N/A')}\n"
-            f"**Depth:** {evaluation_feedback_dict.get('depth', 'N/A')}\n"
-            f"**Relevance:** {evaluation_feedback_dict.get('relevance', 'N/A')}\n"
-            f"**Score:** {evaluation_feedback_dict.get('score', 'N/A')}/10\n\n"
-            f"**Detailed Feedback:**\n{evaluation_feedback_dict.get('detailed_feedback', '')}\n\n"
-            f"**Suggestions for Improvement:**\n{suggestions_text}" # Use the formatted suggestions_text
-        ).strip()
-
-        return {
-            "message": "Answer submitted and next question generated successfully",
-            "next_question": next_question_text,
-            "evaluation_feedback": evaluation_feedback_dict, # Keep the structured dict
-            "display_feedback": display_feedback_str # Add the display-friendly string
-        }
+        return _build_answer_response(next_question_text, evaluation_feedback_dict)
 
+    except HTTPException:
+        raise
     except Exception as e:
         print(f"[ERROR] Error processing answer: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -0,0 +1,52 @@
+# ai-interview-coach-backend/serve.py
+"""
+Multi-process serving entry point.
+
+    python serve.py                      # one worker per CPU core (or $WEB_CONCURRENCY)
+    python serve.py --workers 4 --port 8000
+
+Each worker is a separate process with its own copy of the app, so idempotency results and
+the locks on in-flight idempotent requests go through shared_state. With more than one
+worker, set SHARED_STATE_URL to a Redis URL (redis://host:6379/0), or run
+`python redis_standin.py` for local development.
+
+On SIGTERM/SIGINT each worker stops accepting connections, waits up to
+GRACEFUL_SHUTDOWN_SECONDS for in-flight requests, then the app lifespan waits for any
+Gemini calls still running in worker threads before closing its channels.
+
+Under gunicorn the equivalent is:
+    gunicorn main:app -k uvicorn.workers.UvicornWorker -w 4 --graceful-timeout 30
+"""
+import argparse
+import os
+import uvicorn
+from draining import GRACEFUL_SHUTDOWN_SECONDS
+from shared_state import SHARED_STATE_URL
+
+
+def default_workers() -> int:
+    return int(os.getenv("WEB_CONCURRENCY", os.cpu_count() or 1))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--host", default=os.getenv("HOST", "0.0.0.0"))
+    parser.add_argument("--port", type=int, default=int(os.getenv("PORT", "8000")))
+    parser.add_argument("--workers", type=int, default=default_workers())
+    parser.add_argument("--app", default="main:app", help="ASGI app import string")
+    args = parser.parse_args()
+
+    if args.workers > 1 and SHARED_STATE_URL.startswith("memory://"):
+        print(
+            "[WARN] Running several workers with SHARED_STATE_URL=memory://; each worker keeps its own "
+            "idempotency state. Point SHARED_STATE_URL at Redis for correct deduplication."
+        )
+
+    uvicorn.run(
+        args.app,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=int(GRACEFUL_SHUTDOWN_SECONDS),
+        proxy_headers=True,
+    )
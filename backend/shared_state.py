@@ -0,0 +1,154 @@
+# ai-interview-coach-backend/shared_state.py
+import os
+import time
+from collections import OrderedDict
+import redis.asyncio as redis
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# Where state shared between workers lives: idempotency results and the locks on in-flight keys.
+# Backends also provide an incr() counter primitive, not used by any endpoint yet.
+# memory:// keeps it in this process, which is only correct with a single worker. For several
+# workers point this at Redis (redis://host:6379/0) or at `python redis_standin.py` locally.
+SHARED_STATE_URL = os.getenv("SHARED_STATE_URL", "memory://")
+MEMORY_STATE_MAX_ENTRIES = int(os.getenv("MEMORY_STATE_MAX_ENTRIES", "10000"))
+
+# Compare-and-delete / compare-and-expire, atomic on the Redis side
+DELETE_IF_EQUALS_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("del", KEYS[1])
+end
+return 0
+"""
+EXPIRE_IF_EQUALS_SCRIPT = """
+if redis.call("get", KEYS[1]) == ARGV[1] then
+    return redis.call("pexpire", KEYS[1], ARGV[2])
+end
+return 0
+"""
+
+
+class MemoryStateBackend:
+    """
+    In-process stand-in for the Redis backend, with the same async interface.
+    Values are bytes; expired entries are dropped lazily and the oldest entries are evicted past max_entries.
+    """
+
+    def __init__(self, max_entries: int = MEMORY_STATE_MAX_ENTRIES):
+        self.max_entries = max_entries
+        # key -> (expires_at or None, value)
+        self._entries: "OrderedDict[str, tuple[float | None, bytes]]" = OrderedDict()
+
+    def _live(self, key: str):
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, _ = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        return entry
+
+    def _store(self, key: str, value: bytes, ttl_seconds: float | None) -> None:
+        expires_at = time.monotonic() + ttl_seconds if ttl_seconds else None
+        self._entries[key] = (expires_at, value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    async def get(self, key: str) -> bytes | None:
+        entry = self._live(key)
+        return entry[1] if entry else None
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None, only_if_absent: bool = False) -> bool:
+        if only_if_absent and self._live(key) is not None:
+            return False
+        self._store(key, value, ttl_seconds)
+        return True
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+
+    async def delete_if_equals(self, key: str, value: bytes) -> bool:
+        """
+        Deletes key only if it still holds value (releasing a lock we own, not someone else's).
+        """
+        entry = self._live(key)
+        if entry is None or entry[1] != value:
+            return False
+        del self._entries[key]
+        return True
+
+    async def expire_if_equals(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        """
+        Resets key's TTL only if it still holds value (extending a lock we own).
+        """
+        entry = self._live(key)
+        if entry is None or entry[1] != value:
+            return False
+        self._entries[key] = (time.monotonic() + ttl_seconds, value)
+        return True
+
+    async def incr(self, key: str, ttl_seconds: float | None = None, amount: int = 1) -> int:
+        """
+        Increments a counter; the TTL is set when the counter is created (fixed-window rate limits).
+        """
+        entry = self._live(key)
+        if entry is None:
+            self._store(key, str(amount).encode(), ttl_seconds)
+            return amount
+        expires_at, value = entry
+        count = int(value) + amount
+        self._entries[key] = (expires_at, str(count).encode())
+        return count
+
+    async def close(self) -> None:
+        self._entries.clear()
+
+
+class RedisStateBackend:
+    """
+    Shared backend speaking the Redis protocol, so state is visible to every worker process.
+    """
+
+    def __init__(self, url: str):
+        self.client = redis.from_url(url)
+        self._delete_if_equals = self.client.register_script(DELETE_IF_EQUALS_SCRIPT)
+        self._expire_if_equals = self.client.register_script(EXPIRE_IF_EQUALS_SCRIPT)
+
+    async def get(self, key: str) -> bytes | None:
+        return await self.client.get(key)
+
+    async def set(self, key: str, value: bytes, ttl_seconds: float | None = None, only_if_absent: bool = False) -> bool:
+        px = int(ttl_seconds * 1000) if ttl_seconds else None
+        return bool(await self.client.set(key, value, px=px, nx=only_if_absent))
+
+    async def delete(self, key: str) -> None:
+        await self.client.delete(key)
+
+    async def delete_if_equals(self, key: str, value: bytes) -> bool:
+        return bool(await self._delete_if_equals(keys=[key], args=[value]))
+
+    async def expire_if_equals(self, key: str, value: bytes, ttl_seconds: float) -> bool:
+        return bool(await self._expire_if_equals(keys=[key], args=[value, int(ttl_seconds * 1000)]))
+
+    async def incr(self, key: str, ttl_seconds: float | None = None, amount: int = 1) -> int:
+        count = await self.client.incr(key, amount)
+        if count == amount and ttl_seconds:
+            await self.client.pexpire(key, int(ttl_seconds * 1000))
+        return count
+
+    async def close(self) -> None:
+        await self.client.aclose()
+
+
+def create_backend(url: str):
+    if url.startswith("memory://"):
+        return MemoryStateBackend()
+    if url.startswith(("redis://", "rediss://", "unix://")):
+        return RedisStateBackend(url)
+    raise ValueError(f"Unsupported SHARED_STATE_URL: {url}")
+
+
+shared_state = create_backend(SHARED_STATE_URL)
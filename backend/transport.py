@@ -0,0 +1,158 @@
+# ai-interview-coach-backend/transport.py
+import asyncio
+import os
+import grpc
+import firebase_admin
+from cachecontrol import CacheControlAdapter
+from firebase_admin import auth, firestore, _token_gen
+import google.ai.generativelanguage as glm
+from google.generativeai import client as genai_client
+from dotenv import load_dotenv
+
+load_dotenv()
+
+# NOTE: setup_transport() relies on private SDK internals, checked against the versions pinned in
+# requirements.txt (firebase-admin==6.9.0, google-generativeai==0.8.5, google-cloud-firestore==2.21.0):
+#   - google.generativeai.client._client_manager.clients (default Gemini clients)
+#   - firestore Client._firestore_api (lazily created GAPIC client)
+#   - firebase_admin.auth._get_client(app)._token_verifier.request.session (cert fetch session)
+# Any failure there is logged and the app starts with the SDK defaults instead.
+
+# --- Shared transport settings for outbound Google API calls (Gemini, Firestore, Firebase Auth) ---
+# gRPC keep-alive detects dead HTTP/2 connections during calls so they aren't left hanging.
+# gRPC servers by default reject pings on idle connections more often than every 5 minutes (GOAWAY
+# too_many_pings, which drops the connection), so idle pings are off and pings without data are capped
+# at the gRPC default. Only enable GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS with a GRPC_KEEPALIVE_TIME_MS the server allows.
+GRPC_KEEPALIVE_TIME_MS = int(os.getenv("GRPC_KEEPALIVE_TIME_MS", "30000"))
+GRPC_KEEPALIVE_TIMEOUT_MS = int(os.getenv("GRPC_KEEPALIVE_TIMEOUT_MS", "10000"))
+GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS = int(os.getenv("GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS", "0"))
+GRPC_MAX_PINGS_WITHOUT_DATA = int(os.getenv("GRPC_MAX_PINGS_WITHOUT_DATA", "2"))
+# Pool sizes for the HTTP/1.1 session used by Firebase to fetch token-signing certificates.
+HTTP_POOL_CONNECTIONS = int(os.getenv("HTTP_POOL_CONNECTIONS", "10"))
+HTTP_POOL_MAXSIZE = int(os.getenv("HTTP_POOL_MAXSIZE", "20"))
+# How long startup waits for each channel to connect before carrying on cold.
+CHANNEL_READY_TIMEOUT_SECONDS = float(os.getenv("CHANNEL_READY_TIMEOUT_SECONDS", "10"))
+
+
+def grpc_channel_options() -> list[tuple[str, int]]:
+    """
+    Channel options applied to every gRPC channel we create.
+    """
+    return [
+        ("grpc.keepalive_time_ms", GRPC_KEEPALIVE_TIME_MS),
+        ("grpc.keepalive_timeout_ms", GRPC_KEEPALIVE_TIMEOUT_MS),
+        ("grpc.keepalive_permit_without_calls", GRPC_KEEPALIVE_PERMIT_WITHOUT_CALLS),
+        ("grpc.http2.max_pings_without_data", GRPC_MAX_PINGS_WITHOUT_DATA),
+        ("grpc.max_send_message_length", -1),
+        ("grpc.max_receive_message_length", -1),
+    ]
+
+
+def with_shared_options(create_channel):
+    """
+    Wraps a channel factory so the channels it creates also get grpc_channel_options().
+    Options passed by the caller are kept unless we override the same key.
+    """
+    def create(*args, options=(), **kwargs):
+        merged = dict(options or ())
+        merged.update(grpc_channel_options())
+        return create_channel(*args, options=list(merged.items()), **kwargs)
+    return create
+
+
+def _make_gemini_clients() -> dict:
+    client_options = {"api_key": os.getenv("GEMINI_API_KEY")}
+    sync_transport_cls = glm.GenerativeServiceClient.get_transport_class("grpc")
+    async_transport_cls = glm.GenerativeServiceClient.get_transport_class("grpc_asyncio")
+
+    def sync_transport(**kwargs):
+        return sync_transport_cls(channel=with_shared_options(sync_transport_cls.create_channel), **kwargs)
+
+    def async_transport(**kwargs):
+        return async_transport_cls(channel=with_shared_options(async_transport_cls.create_channel), **kwargs)
+
+    return {
+        "generative": glm.GenerativeServiceClient(transport=sync_transport, client_options=client_options),
+        "generative_async": glm.GenerativeServiceAsyncClient(transport=async_transport, client_options=client_options),
+    }
+
+
+# Gemini clients installed by setup_transport(), closed again by close_transport()
+_installed_gemini_clients: dict = {}
+
+
+def _sync_channel_ready(channel: grpc.Channel):
+    return asyncio.to_thread(grpc.channel_ready_future(channel).result, timeout=CHANNEL_READY_TIMEOUT_SECONDS)
+
+
+async def _wait_ready(name: str, warm_up) -> None:
+    # warm_up is called inside the try, so failures while reaching into SDK internals are caught too
+    try:
+        await asyncio.wait_for(warm_up(), timeout=CHANNEL_READY_TIMEOUT_SECONDS)
+        print(f"[INFO] {name} warmed up")
+    except Exception as e:
+        print(f"[WARN] {name} warm-up failed at startup, continuing cold: {e!r}")
+
+
+def _prefetch_firebase_certs() -> None:
+    # Resize the cert session's pools by mounting fresh cache-aware adapters (sharing the existing
+    # cache) and closing the old ones, rather than swapping pool managers under a live adapter.
+    verifier_request = auth._get_client(firebase_admin.get_app())._token_verifier.request
+    session = verifier_request.session
+    for prefix, old_adapter in list(session.adapters.items()):
+        session.mount(prefix, CacheControlAdapter(
+            cache=getattr(old_adapter, "cache", None),
+            pool_connections=HTTP_POOL_CONNECTIONS,
+            pool_maxsize=HTTP_POOL_MAXSIZE
+        ))
+        old_adapter.close()
+    # The token verifier caches the signing certificates per Cache-Control, so fetching them
+    # once here takes the first verify_id_token() call off the cold path.
+    verifier_request(url=_token_gen.ID_TOKEN_CERT_URI)
+
+
+def _install_gemini_clients() -> None:
+    clients = _make_gemini_clients()
+    # google.generativeai looks up its default clients here; GenerativeModel picks them up lazily.
+    genai_client._client_manager.clients.update(clients)
+    _installed_gemini_clients.update(clients)
+
+
+async def setup_transport() -> None:
+    """
+    Called from the app lifespan. Installs Gemini clients that use the shared channel options,
+    then opens the Gemini and Firestore channels and prefetches Firebase certs so the first
+    requests don't pay for connection setup. Any step that fails is logged and skipped.
+    """
+    try:
+        _install_gemini_clients()
+    except Exception as e:
+        print(f"[WARN] Could not install Gemini clients with shared channel options, using SDK defaults: {e}")
+
+    warm_ups = [
+        _wait_ready("Firestore", lambda: _sync_channel_ready(firestore.client()._firestore_api.transport.grpc_channel)),
+        _wait_ready("Firebase certs", lambda: asyncio.to_thread(_prefetch_firebase_certs)),
+    ]
+    if _installed_gemini_clients:
+        warm_ups += [
+            _wait_ready("Gemini (async)", lambda: _installed_gemini_clients["generative_async"].transport.grpc_channel.channel_ready()),
+            _wait_ready("Gemini", lambda: _sync_channel_ready(_installed_gemini_clients["generative"].transport.grpc_channel)),
+        ]
+    await asyncio.gather(*warm_ups)
+
+
+async def close_transport() -> None:
+    """
+    Called from the app lifespan on shutdown. Closes the Gemini channels installed by setup_transport().
+    """
+    async_client = _installed_gemini_clients.pop("generative_async", None)
+    sync_client = _installed_gemini_clients.pop("generative", None)
+    try:
+        for name in ("generative_async", "generative"):
+            genai_client._client_manager.clients.pop(name, None)
+    except Exception as e:
+        print(f"[WARN] Could not unregister Gemini clients: {e}")
+    if async_client is not None:
+        await async_client.transport.close()
+    if sync_client is not None:
+        sync_client.transport.close()